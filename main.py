@@ -8,25 +8,68 @@ structured data ready for database insertion.
 import argparse
 from difflib import SequenceMatcher
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+import time
+import tomllib
 import unicodedata
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import TypedDict
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Constants
 SCHEDULE_URL = "https://www.tokyo-dome.co.jp/en/dome/event/schedule.html"
+SCHEDULE_CACHE_TTL_SECONDS = 15 * 60
 D1_DATABASE_NAME = "tokyo-dome-events"
+WRANGLER_CONFIG_PATH = Path(__file__).with_name("wrangler.toml")
+D1_API_URL = "https://api.cloudflare.com/client/v4/accounts/{account_id}/d1/database/{database_id}/query"
+LOAD_EVENTS_SQL = "SELECT date, name, COALESCE(start_time, '00:00') AS start_time FROM events;"
+UPSERT_BATCH_SIZE = 100
+CREATE_UNIQUE_INDEX_SQL = "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_date_name ON events(date, name);"
 EVENT_NAME_SIMILARITY_THRESHOLD = 0.80
-
-
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
+)
+
+# Category labels that may precede the event name in a cell without a link
+EVENT_CATEGORY_PREFIXES = ("コンサート", "スポーツ", "その他", "野球")
+
+# Maps Japanese brackets 「」 to regular quotes in a single pass
+JAPANESE_QUOTES_TABLE = str.maketrans({"「": '"', "」": '"'})
+
+# Pre-compiled regular expressions
+WHITESPACE_RE = re.compile(r"\s+")
+DAY_OF_MONTH_RE = re.compile(r"(\d{1,2})")
+# Matches every start marker followed by its time in a single scan over the text.
+# The marker groups are listed in priority order (see START_TIME_MARKERS):
+# 開演 (also after a ／ separator) beats 開始, which beats "Start time",
+# which beats a bare "Starts"/"start".
+START_TIME_RE = re.compile(
+    r"(?:(?P<kaien>開演)|(?P<kaishi>開始)|(?P<start_time>[Ss]tarts?\s+time\s)|(?P<start>[Ss]tarts?))"
+    r"\s*(?P<time>\d{1,2}:\d{2})"
+)
+START_TIME_MARKERS = ("kaien", "kaishi", "start_time", "start")
+
+
+@lru_cache(maxsize=4096)
 def normalize_event_name(name: str) -> str:
     """Normalize event name for deduplication comparison.
 
+    Results are memoized, since the same names recur across dedup passes.
+
     Handles:
     - Full-width to half-width character conversion (NFKC normalization)
     - Multiple spaces collapsed to single space
@@ -42,13 +85,16 @@ def normalize_event_name(name: str) -> str:
     """
     # NFKC normalization: converts full-width chars to half-width equivalents
     # e.g., ＜ → <, ＞ → >, full-width space → regular space
-    normalized = unicodedata.normalize("NFKC", name)
+    # Pure ASCII text is already NFKC-normalized, so skip the lookup for it
+    is_ascii = name.isascii()
+    normalized = name if is_ascii else unicodedata.normalize("NFKC", name)
 
-    # Replace Japanese brackets with regular quotes
-    normalized = normalized.replace("「", '"').replace("」", '"')
+    # Replace Japanese brackets with regular quotes (they never occur in ASCII text)
+    if not is_ascii:
+        normalized = normalized.translate(JAPANESE_QUOTES_TABLE)
 
     # Collapse multiple whitespace to single space and trim
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = WHITESPACE_RE.sub(" ", normalized).strip()
 
     # Lowercase for case-insensitive comparison
     normalized = normalized.lower()
@@ -64,41 +110,96 @@ class Event(TypedDict):
     start_time: str  # HH:MM format
 
 
-def name_similarity(left: str, right: str) -> float:
-    """Calculate similarity ratio between two normalized event names."""
-    return SequenceMatcher(None, left, right).ratio()
+def find_same_event_name(name: str, candidates: Iterable[str]) -> int | None:
+    """Find the first normalized candidate name that refers to the same event as `name`.
 
+    SequenceMatcher caches its analysis of the second sequence, so `name` is
+    set once as seq2 and only seq1 is swapped per candidate. The cheap upper
+    bounds (length ratio, then shared character counts) reject most
+    candidates before the full ratio is computed.
 
-def is_same_event_name(left: str, right: str) -> bool:
-    """Check if two normalized event names should be treated as the same event."""
-    return name_similarity(left, right) >= EVENT_NAME_SIMILARITY_THRESHOLD
+    Args:
+        name: Normalized event name to look up.
+        candidates: Normalized event names to compare against, in order.
 
+    Returns:
+        Index of the first candidate with similarity above the threshold, or None.
+    """
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(name)
+    for index, candidate in enumerate(candidates):
+        matcher.set_seq1(candidate)
+        if (
+            matcher.real_quick_ratio() >= EVENT_NAME_SIMILARITY_THRESHOLD
+            and matcher.quick_ratio() >= EVENT_NAME_SIMILARITY_THRESHOLD
+            and matcher.ratio() >= EVENT_NAME_SIMILARITY_THRESHOLD
+        ):
+            return index
+    return None
+
+
+def prefer_event_name(
+    current: Event, current_normalized: str, candidate: Event, candidate_normalized: str
+) -> Event:
+    """Choose the more descriptive event when two entries represent the same event.
 
-def prefer_event_name(current: Event, candidate: Event) -> Event:
-    """Choose the more descriptive event when two entries represent the same event."""
-    current_normalized = normalize_event_name(current["name"])
-    candidate_normalized = normalize_event_name(candidate["name"])
+    The normalized names are passed in by the caller, which already holds them.
+    """
     if len(candidate_normalized) > len(current_normalized):
         return candidate
     return current
 
 
-def fetch_schedule_html() -> str:
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session with keep-alive and retries.
+
+    Returns:
+        Session that reuses TCP/TLS connections across requests.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = create_http_session()
+
+
+# Last fetched schedule page as (time.monotonic() at fetch, HTML bytes)
+_schedule_cache: tuple[float, bytes] | None = None
+
+
+def fetch_schedule_html() -> bytes:
     """Fetch the raw HTML from Tokyo Dome schedule page.
 
+    Repeated calls within SCHEDULE_CACHE_TTL_SECONDS return the cached page
+    instead of fetching it again.
+
     Returns:
-        Raw HTML content of the schedule page.
+        Raw HTML bytes of the schedule page (UTF-8 encoded).
 
     Raises:
         requests.RequestException: If the HTTP request fails.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
-    }
-    response = requests.get(SCHEDULE_URL, headers=headers, timeout=30)
+    global _schedule_cache
+
+    now = time.monotonic()
+    if _schedule_cache is not None and now - _schedule_cache[0] < SCHEDULE_CACHE_TTL_SECONDS:
+        return _schedule_cache[1]
+
+    response = _SESSION.get(SCHEDULE_URL, timeout=30)
     response.raise_for_status()
-    return response.text
+    # Hand the raw bytes to lxml, which decodes UTF-8 natively (see HTML_PARSER)
+    _schedule_cache = (now, response.content)
+    return response.content
 
 
 def extract_start_time(text: str) -> str | None:
@@ -117,49 +218,69 @@ def extract_start_time(text: str) -> str | None:
     Returns:
         Start time in HH:MM format, or None if not found.
     """
-    # Pattern to match various start time formats
-    # Looks for 開演, 開始, Starts, start followed by time
-    patterns = [
-        r"開演\s*(\d{1,2}:\d{2})",  # Japanese: 開演 17:00
-        r"開始\s*(\d{1,2}:\d{2})",  # Japanese: 開始 17:00
-        r"[Ss]tarts?\s+time\s+(\d{1,2}:\d{2})",  # English: Start time 17:00
-        r"[Ss]tarts?\s*(\d{1,2}:\d{2})",  # English: Starts 17:00 or start 17:00
-        r"／開演\s*(\d{1,2}:\d{2})",  # With separator: ／開演 17:00
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            time_str = match.group(1)
-            # Ensure HH:MM format (pad hour if needed)
-            parts = time_str.split(":")
-            return f"{int(parts[0]):02d}:{parts[1]}"
+    # Cheap substring prefilter: cells without any start marker skip the regex
+    # ("tart" covers Start, start and Starts)
+    if "開演" not in text and "開始" not in text and "tart" not in text:
+        return None
+
+    # The highest-priority marker wins; among equal markers, the first in the text
+    best_match = None
+    best_priority = len(START_TIME_MARKERS)
+    for match in START_TIME_RE.finditer(text):
+        priority = next(
+            index for index, marker in enumerate(START_TIME_MARKERS) if match.group(marker)
+        )
+        if priority < best_priority:
+            best_match, best_priority = match, priority
+            if priority == 0:
+                break
+
+    if best_match is None:
+        return None
+
+    # Ensure HH:MM format (pad hour if needed)
+    hour, minute = best_match.group("time").split(":")
+    return f"{int(hour):02d}:{minute}"
 
-    return None
 
+def get_text(element: HtmlElement) -> str:
+    """Get the text of an element with each text node stripped.
 
-def extract_event_name(cell: BeautifulSoup) -> str | None:
+    Equivalent to BeautifulSoup's get_text(strip=True): comments are skipped
+    and the stripped text nodes are concatenated without a separator.
+
+    Args:
+        element: lxml element to extract text from.
+
+    Returns:
+        Concatenated text content of the element.
+    """
+    return "".join(text.strip() for text in element.itertext())
+
+
+def extract_event_name(cell: HtmlElement) -> str | None:
     """Extract event name from a table cell.
 
     Args:
-        cell: BeautifulSoup element containing event information.
+        cell: lxml element containing event information.
 
     Returns:
         Event name extracted from link text or cell content.
     """
     # Try to find the event name in a link first
-    link = cell.find("a")
-    if link:
-        return link.get_text(strip=True)
+    link = cell.find(".//a")
+    if link is not None:
+        return get_text(link)
 
     # Fall back to cell text, removing time information
-    text = cell.get_text(strip=True)
+    text = get_text(cell)
     # Remove common prefixes like コンサート, 野球, etc.
-    prefixes = ["コンサート", "スポーツ", "その他", "野球"]
-    for prefix in prefixes:
-        if text.startswith(prefix):
-            text = text[len(prefix) :].strip()
-            break
+    # (single C-level check first; the loop only runs when a prefix matches)
+    if text.startswith(EVENT_CATEGORY_PREFIXES):
+        for prefix in EVENT_CATEGORY_PREFIXES:
+            if text.startswith(prefix):
+                text = text[len(prefix) :].strip()
+                break
 
     return text if text else None
 
@@ -169,86 +290,133 @@ MONTH_NAMES = [
     "July", "August", "September", "October", "November", "December"
 ]
 
+MONTH_NUMBERS = {name: number for number, name in enumerate(MONTH_NAMES, start=1)}
+
+# Matches a month header label: Japanese "2025年12月" or English "December 2025"
+MONTH_LABEL_RE = re.compile(rf"(\d{{4}})年(\d{{1,2}})月|({'|'.join(MONTH_NAMES)})\s*(\d{{4}})")
+
+# Matches <p> elements whose class list contains c-ttl-set-calender
+MONTH_HEADER_XPATH = etree.XPath(
+    "//p[contains(concat(' ', normalize-space(@class), ' '), ' c-ttl-set-calender ')]"
+)
+NEXT_TABLE_XPATH = etree.XPath("following::table[1]")
+
+# Reused for every parse of the schedule page; the page is always UTF-8,
+# so the parser decodes the raw bytes directly instead of sniffing the charset
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_month_labels(text: str) -> set[tuple[int, int]]:
+    """Parse every month label in a header text.
+
+    Args:
+        text: Header text or comment content.
+
+    Returns:
+        Set of (year, month) pairs found in the text.
+    """
+    labels = set()
+    for match in MONTH_LABEL_RE.finditer(text):
+        japanese_year, japanese_month, month_name, english_year = match.groups()
+        if japanese_year:
+            labels.add((int(japanese_year), int(japanese_month)))
+        else:
+            labels.add((int(english_year), MONTH_NUMBERS[month_name]))
+    return labels
+
 
-def find_month_table(soup: BeautifulSoup, year: int, month: int) -> BeautifulSoup | None:
-    """Find the table element for a specific month.
+def find_month_tables(
+    tree: HtmlElement, months: list[tuple[int, int]]
+) -> dict[tuple[int, int], HtmlElement]:
+    """Find the table elements for several months in one pass over the month headers.
 
     The page uses <p class="c-ttl-set-calender"> to mark each month section.
     The text can be Japanese (e.g., "2025年12月") or English (e.g., "December 2025").
+    Each header label is parsed once and looked up by (year, month); the walk
+    stops as soon as every requested month has been found.
 
     Args:
-        soup: BeautifulSoup parsed HTML.
-        year: Target year (e.g., 2025).
-        month: Target month (1-12).
+        tree: lxml parsed HTML document.
+        months: (year, month) pairs to look up.
 
     Returns:
-        The table element for the specified month, or None if not found.
+        Mapping of (year, month) to its table element; months without a table are omitted.
     """
-    # Build patterns to match the month header
-    # Japanese format: 2025年12月 (with zero-padded month)
-    japanese_pattern = f"{year}年{month:02d}月"
-    # English format: December 2025
-    english_pattern = f"{MONTH_NAMES[month - 1]} {year}"
-
-    # Find all month header elements
-    month_headers = soup.find_all("p", class_="c-ttl-set-calender")
-
-    for header in month_headers:
-        # Get the raw HTML to check for Japanese text in comments
-        header_html = str(header)
-        header_text = header.get_text(strip=True)
-
-        # Check if this header matches our target month
-        if japanese_pattern in header_html or japanese_pattern in header_text or english_pattern in header_text:
-            # Find the next table after this header
-            table = header.find_next("table")
-            if table:
-                return table
+    pending = set(months)
+    tables: dict[tuple[int, int], HtmlElement] = {}
 
-    return None
+    for header in MONTH_HEADER_XPATH(tree):
+        if not pending:
+            break
+
+        labels = parse_month_labels(get_text(header))
+        # The Japanese label may only be present in an HTML comment
+        for comment in header.iter(etree.Comment):
+            labels |= parse_month_labels(comment.text or "")
+
+        matched = labels & pending
+        if not matched:
+            continue
+
+        # Find the next table after this header
+        next_tables = NEXT_TABLE_XPATH(header)
+        if next_tables:
+            for key in matched:
+                tables[key] = next_tables[0]
+            pending -= matched
+
+    return tables
+
+
+def parse_schedule_html(html: bytes) -> HtmlElement:
+    """Parse the raw schedule page HTML into an lxml document tree.
+
+    The page is parsed once per run and the resulting tree is shared by
+    every month lookup.
+
+    Args:
+        html: Raw HTML bytes of the schedule page.
+
+    Returns:
+        Root element of the parsed HTML document.
+    """
+    return lxml.html.document_fromstring(html, parser=HTML_PARSER)
 
 
-def parse_events(html: str, year: int, month: int) -> list[Event]:
-    """Parse HTML and extract events for the specified month.
+def parse_events(table: HtmlElement, year: int, month: int) -> list[Event]:
+    """Extract events from the schedule table of the specified month.
 
     Args:
-        html: Raw HTML content of the schedule page.
+        table: Table element for the month, as returned by find_month_tables.
         year: Target year (e.g., 2025).
         month: Target month (1-12).
 
     Returns:
         List of Event dictionaries for the specified month (fuzzy deduplicated).
     """
-    soup = BeautifulSoup(html, "lxml")
     events: list[Event] = []
 
-    # Find the table for the target month
-    target_table = find_month_table(soup, year, month)
-
-    if not target_table:
-        return []
+    # Year and month are fixed for the whole table, so format them once
+    date_prefix = f"{year}-{month:02d}-"
 
     # Parse table rows
-    rows = target_table.find_all("tr")
-    for row in rows:
-        cells = row.find_all(["td", "th"])
+    for row in table.iter("tr"):
+        cells = list(row.iter("td", "th"))
         if len(cells) < 2:
             continue
 
         # First cell contains the date (e.g., "06 (土)")
-        date_cell = cells[0].get_text(strip=True)
-        date_match = re.match(r"(\d{1,2})", date_cell)
+        date_cell = get_text(cells[0])
+        date_match = DAY_OF_MONTH_RE.match(date_cell)
         if not date_match:
             continue
 
         day = int(date_match.group(1))
 
         # Second cell contains event information
-        event_cell = cells[1] if len(cells) > 1 else None
-        if not event_cell:
-            continue
+        event_cell = cells[1]
 
-        cell_text = event_cell.get_text(strip=True)
+        cell_text = get_text(event_cell)
         if not cell_text:
             continue
 
@@ -261,7 +429,7 @@ def parse_events(html: str, year: int, month: int) -> list[Event]:
         start_time = extract_start_time(cell_text) or "00:00"
 
         # Format date as YYYY-MM-DD
-        date_str = f"{year}-{month:02d}-{day:02d}"
+        date_str = f"{date_prefix}{day:02d}"
 
         events.append(Event(
             date=date_str,
@@ -308,19 +476,17 @@ def deduplicate_events(events: list[Event]) -> list[Event]:
         normalized_name = normalize_event_name(event["name"])
         candidates = grouped_events.setdefault(key, [])
 
-        match_index = None
-        for index, (_, existing_normalized_name) in enumerate(candidates):
-            if is_same_event_name(existing_normalized_name, normalized_name):
-                match_index = index
-                break
-
+        match_index = find_same_event_name(normalized_name, (name for _, name in candidates))
         if match_index is None:
             candidates.append((event, normalized_name))
             continue
 
-        existing_event = candidates[match_index][0]
-        preferred_event = prefer_event_name(existing_event, event)
-        candidates[match_index] = (preferred_event, normalize_event_name(preferred_event["name"]))
+        existing_event, existing_normalized_name = candidates[match_index]
+        preferred_event = prefer_event_name(
+            existing_event, existing_normalized_name, event, normalized_name
+        )
+        if preferred_event is event:
+            candidates[match_index] = (event, normalized_name)
 
     return [event for grouped in grouped_events.values() for event, _ in grouped]
 
@@ -334,12 +500,18 @@ def get_events() -> list[Event]:
     now = datetime.now()
     html = fetch_schedule_html()
 
-    # Parse current month
-    events = parse_events(html, now.year, now.month)
+    # Current month and next month
+    months = [(now.year, now.month), get_next_month(now.year, now.month)]
 
-    # Parse next month
-    next_year, next_month = get_next_month(now.year, now.month)
-    events.extend(parse_events(html, next_year, next_month))
+    # Parse the page once and locate all month tables in a single header walk
+    tree = parse_schedule_html(html)
+    tables = find_month_tables(tree, months)
+
+    events: list[Event] = []
+    for year, month in months:
+        table = tables.get((year, month))
+        if table is not None:
+            events.extend(parse_events(table, year, month))
 
     # Deduplicate across both months
     return deduplicate_events(events)
@@ -361,6 +533,8 @@ def generate_upsert_sql(events: list[Event]) -> str:
     """Generate SQL statements for upserting events.
 
     Uses INSERT OR REPLACE which requires a UNIQUE constraint on (date, name).
+    Rows are batched into multi-row INSERT statements of up to
+    UPSERT_BATCH_SIZE rows each.
 
     Args:
         events: List of Event dictionaries to upsert.
@@ -371,82 +545,48 @@ def generate_upsert_sql(events: list[Event]) -> str:
     if not events:
         return ""
 
-    statements = []
+    rows = []
     for event in events:
         date = escape_sql_string(event["date"])
         name = escape_sql_string(event["name"])
         start_time = escape_sql_string(event["start_time"])
+        rows.append(f"('{date}', '{name}', '{start_time}')")
 
-        stmt = f"INSERT OR REPLACE INTO events (date, name, start_time) VALUES ('{date}', '{name}', '{start_time}');"
-        statements.append(stmt)
+    # One multi-row INSERT per batch keeps each statement well under D1's size limit
+    statements = []
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        values = ",\n".join(rows[start : start + UPSERT_BATCH_SIZE])
+        statements.append(f"INSERT OR REPLACE INTO events (date, name, start_time) VALUES\n{values};")
 
     return "\n".join(statements)
 
 
-def remove_duplicates_from_db() -> bool:
-    """Remove duplicate events from the database, keeping the one with the latest start_time.
-
-    Duplicates are defined as rows with the same (date, name).
+def generate_rewrite_sql(events: list[Event]) -> str:
+    """Generate SQL that replaces the whole events table with the given events.
 
-    Returns:
-        True if successful, False otherwise.
-    """
-    # Delete duplicates, keeping the row with the MAX(rowid) for each (date, name)
-    # This keeps the most recently inserted record
-    sql = """
-    DELETE FROM events
-    WHERE rowid NOT IN (
-        SELECT MAX(rowid)
-        FROM events
-        GROUP BY date, name
-    );
-    """
-
-    try:
-        result = subprocess.run(
-            ["wrangler", "d1", "execute", D1_DATABASE_NAME, "--command", sql.strip(), "--remote"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        print("Removed duplicate events from database.")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Warning: Could not remove duplicates: {e.stderr}")
-        return False
+    The table is emptied first, so the unique index can always be created.
 
-
-def ensure_unique_index() -> bool:
-    """Ensure the unique index exists on the events table.
-
-    First removes any existing duplicates, then creates the index.
+    Args:
+        events: Full, deduplicated list of Event dictionaries to store.
 
     Returns:
-        True if successful, False otherwise.
+        SQL script for the table rewrite.
     """
-    # First, remove any existing duplicates so the unique index can be created
-    remove_duplicates_from_db()
-
-    sql = "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_date_name ON events(date, name);"
-
-    try:
-        result = subprocess.run(
-            ["wrangler", "d1", "execute", D1_DATABASE_NAME, "--command", sql, "--remote"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Warning: Could not create unique index: {e.stderr}")
-        return False
+    return "\n".join(
+        [
+            "DELETE FROM events;",
+            CREATE_UNIQUE_INDEX_SQL,
+            generate_upsert_sql(events),
+        ]
+    )
 
 
 def save_events_to_d1(events: list[Event]) -> bool:
     """Save events to Cloudflare D1 database using Wrangler CLI.
 
     Loads existing rows, merges with incoming rows, fuzzy-deduplicates,
-    then rewrites the table once.
+    then rewrites the table (and ensures the unique index) in a single
+    Wrangler invocation.
 
     Args:
         events: List of Event dictionaries to save.
@@ -458,21 +598,11 @@ def save_events_to_d1(events: list[Event]) -> bool:
         print("No events to save.")
         return True
 
-    # Ensure the unique index exists
-    ensure_unique_index()
-
     try:
         existing_events = load_events_from_d1()
         merged_events = deduplicate_events(existing_events + events)
 
-        rewrite_sql = "\n".join(
-            [
-                "DELETE FROM events;",
-                generate_upsert_sql(merged_events),
-            ]
-        )
-
-        run_d1_command(rewrite_sql)
+        run_d1_file(generate_rewrite_sql(merged_events))
         print(
             "Successfully saved with fuzzy dedup. "
             f"Incoming: {len(events)}, total rows: {len(merged_events)}."
@@ -504,12 +634,43 @@ def run_d1_command(sql: str, json_output: bool = False) -> str:
     return result.stdout
 
 
+def run_d1_file(sql: str) -> None:
+    """Run a SQL script against D1 from a temporary file.
+
+    Table rewrites go through --file instead of --command so large scripts
+    never hit the OS argument-length limit. Wrangler's stdout is discarded;
+    only stderr is captured, and decoded only when the command fails.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".sql", encoding="utf-8", delete_on_close=False
+    ) as sql_file:
+        sql_file.write(sql)
+        sql_file.close()
+
+        try:
+            subprocess.run(
+                ["wrangler", "d1", "execute", D1_DATABASE_NAME, "--file", sql_file.name, "--remote", "--yes"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            e.stderr = e.stderr.decode("utf-8", errors="replace")
+            raise
+
+
 def load_events_from_d1() -> list[Event]:
     """Load all events from D1 for one-off fuzzy deduplication."""
-    sql = "SELECT date, name, COALESCE(start_time, '00:00') AS start_time FROM events;"
-    raw_output = run_d1_command(sql, json_output=True)
-    payload = json.loads(raw_output)
+    raw_output = run_d1_command(LOAD_EVENTS_SQL, json_output=True)
+    return parse_d1_event_rows(json.loads(raw_output))
 
+
+def parse_d1_event_rows(payload: object) -> list[Event]:
+    """Extract event rows from a D1 query result.
+
+    Wrangler's --json output and the HTTP API's "result" field share the same
+    shape: a list of per-statement entries, each holding a "results" row list.
+    """
     if not isinstance(payload, list):
         return []
 
@@ -538,6 +699,122 @@ def load_events_from_d1() -> list[Event]:
     return rows
 
 
+def get_d1_api_credentials() -> tuple[str, str] | None:
+    """Read Cloudflare account ID and API token for the D1 HTTP API from the environment.
+
+    Returns:
+        Tuple of (account_id, api_token), or None if either is not set.
+    """
+    account_id = os.environ.get("CLOUDFLARE_ACCOUNT_ID")
+    api_token = os.environ.get("CLOUDFLARE_API_TOKEN")
+    if account_id and api_token:
+        return account_id, api_token
+    return None
+
+
+def load_d1_database_id() -> str:
+    """Read the D1 database ID for D1_DATABASE_NAME from wrangler.toml.
+
+    wrangler.toml stays the single source of truth, so the HTTP API path and
+    the Wrangler path always target the same database.
+
+    Returns:
+        The database_id configured for D1_DATABASE_NAME.
+
+    Raises:
+        OSError: If wrangler.toml cannot be read.
+        ValueError: If it is not valid TOML or has no matching D1 database entry.
+    """
+    with WRANGLER_CONFIG_PATH.open("rb") as config_file:
+        config = tomllib.load(config_file)
+
+    for database in config.get("d1_databases", []):
+        if database.get("database_name") == D1_DATABASE_NAME and database.get("database_id"):
+            return database["database_id"]
+
+    raise ValueError(f"no database_id for {D1_DATABASE_NAME!r} in {WRANGLER_CONFIG_PATH.name}")
+
+
+def run_d1_api_query(sql: str, credentials: tuple[str, str], database_id: str) -> list:
+    """Run SQL against D1 through the Cloudflare HTTP API.
+
+    Uses the shared keep-alive session, so every query after the first reuses
+    the TLS connection instead of spawning a Wrangler process.
+
+    Args:
+        sql: One or more SQL statements.
+        credentials: Tuple of (account_id, api_token).
+        database_id: D1 database ID, as returned by load_d1_database_id.
+
+    Returns:
+        Per-statement results (same shape as Wrangler's --json output).
+
+    Raises:
+        requests.RequestException: If the HTTP request fails or D1 reports an error.
+    """
+    account_id, api_token = credentials
+    url = D1_API_URL.format(account_id=account_id, database_id=database_id)
+    response = _SESSION.post(
+        url,
+        json={"sql": sql},
+        headers={"Authorization": f"Bearer {api_token}"},
+        timeout=60,
+    )
+    if not response.ok:
+        raise requests.HTTPError(
+            f"D1 API returned {response.status_code}: {response.text}", response=response
+        )
+
+    payload = response.json()
+    if not isinstance(payload, dict):
+        raise requests.HTTPError(
+            f"D1 API returned an unexpected response body: {response.text}", response=response
+        )
+    if not payload.get("success"):
+        raise requests.HTTPError(f"D1 API query failed: {payload.get('errors')}", response=response)
+    return payload.get("result", [])
+
+
+def save_events_to_d1_api(events: list[Event], credentials: tuple[str, str]) -> bool:
+    """Save events to Cloudflare D1 database using the D1 HTTP API.
+
+    Same merge as save_events_to_d1, but both the load and the rewrite are
+    HTTPS requests on the pooled session instead of Wrangler subprocesses.
+
+    Args:
+        events: List of Event dictionaries to save.
+        credentials: Tuple of (account_id, api_token).
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    if not events:
+        print("No events to save.")
+        return True
+
+    try:
+        database_id = load_d1_database_id()
+    except (OSError, ValueError) as e:
+        print(f"Error reading D1 database ID from {WRANGLER_CONFIG_PATH.name}: {e}")
+        return False
+
+    try:
+        existing_events = parse_d1_event_rows(
+            run_d1_api_query(LOAD_EVENTS_SQL, credentials, database_id)
+        )
+        merged_events = deduplicate_events(existing_events + events)
+
+        run_d1_api_query(generate_rewrite_sql(merged_events), credentials, database_id)
+        print(
+            "Successfully saved with fuzzy dedup via D1 HTTP API. "
+            f"Incoming: {len(events)}, total rows: {len(merged_events)}."
+        )
+        return True
+    except requests.RequestException as e:
+        print(f"Error saving to D1 via HTTP API: {e}")
+        return False
+
+
 def one_off_cleanup_fuzzy_duplicates_in_d1() -> bool:
     """Run one-off fuzzy duplicate cleanup directly on D1."""
     try:
@@ -571,7 +848,7 @@ def one_off_cleanup_fuzzy_duplicates_in_d1() -> bool:
     )
 
     try:
-        run_d1_command(rewrite_sql)
+        run_d1_file(rewrite_sql)
         print(
             "Fuzzy duplicate cleanup completed. "
             f"Removed {removed_count} rows ({len(current_events)} -> {len(deduplicated_events)})."
@@ -598,6 +875,14 @@ def main() -> None:
         action="store_true",
         help="Save parsed events to Cloudflare D1 database",
     )
+    parser.add_argument(
+        "--d1-api",
+        action="store_true",
+        help=(
+            "With --save: write through the Cloudflare D1 HTTP API instead of Wrangler "
+            "(requires CLOUDFLARE_ACCOUNT_ID and CLOUDFLARE_API_TOKEN)"
+        ),
+    )
     parser.add_argument(
         "--cleanup-fuzzy",
         action="store_true",
@@ -618,8 +903,17 @@ def main() -> None:
         print(f"\nTotal events found: {len(events)}")
 
         if args.save:
-            print("\nSaving to Cloudflare D1...")
-            success = save_events_to_d1(events)
+            if args.d1_api:
+                # Opt-in: the D1 HTTP API replaces Wrangler only when explicitly requested
+                credentials = get_d1_api_credentials()
+                if not credentials:
+                    print("Error: --d1-api requires CLOUDFLARE_ACCOUNT_ID and CLOUDFLARE_API_TOKEN to be set.")
+                    sys.exit(1)
+                print("\nSaving to Cloudflare D1 via HTTP API...")
+                success = save_events_to_d1_api(events, credentials)
+            else:
+                print("\nSaving to Cloudflare D1...")
+                success = save_events_to_d1(events)
             if not success:
                 sys.exit(1)
 